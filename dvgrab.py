@@ -9,16 +9,15 @@
 # - Runs dvgrab in a background thread; live logs shown in the UI.
 # - Uses only the Python standard library (tkinter/ttk), no extra deps.
 
+import collections
 import json
 import os
-import re
 import shlex
 import shutil
 import signal
 import subprocess
 import sys
 import threading
-import queue
 from pathlib import Path
 from datetime import datetime
 try:
@@ -33,6 +32,36 @@ CONFIG_DIR = Path.home() / ".config" / "dvgrab-gui"
 CONFIG_FILE = CONFIG_DIR / "config.json"
 DEFAULT_OUTPUT = str(Path.home() / "Videos")
 LOG_LINES_MAX = 5000
+LOG_TRIM_LINES = 1000  # drop this many lines at once when over LOG_LINES_MAX
+SAVE_DEBOUNCE_MS = 500
+READ_CHUNK = 65536
+
+# Helper binaries, looked up once at startup rather than on every click.
+_KDIALOG = shutil.which("kdialog")
+_ZENITY = shutil.which("zenity")
+_DVGRAB = shutil.which("dvgrab")
+
+_DESKTOP = (os.environ.get("XDG_CURRENT_DESKTOP", "") + " " +
+            os.environ.get("DESKTOP_SESSION", "")).upper()
+_PREFER_KDE = "KDE" in _DESKTOP or "PLASMA" in _DESKTOP or os.environ.get("KDE_FULL_SESSION") == "true"
+
+def _detect_folder_opener():
+    # Launch the desktop's own file manager directly; xdg-open is a shell
+    # script that works this out again (and forks) on every call.
+    candidates = []
+    if _PREFER_KDE:
+        candidates.append("dolphin")
+    if "GNOME" in _DESKTOP or "UNITY" in _DESKTOP:
+        candidates.append("nautilus")
+    if "XFCE" in _DESKTOP:
+        candidates.append("thunar")
+    for name in candidates:
+        path = shutil.which(name)
+        if path:
+            return [path]
+    return ["xdg-open"]
+
+_FOLDER_OPENER = _detect_folder_opener()
 
 # --------------------------- Utilities & Config ---------------------------
 def system_pick_directory(initial_dir=None):
@@ -43,20 +72,18 @@ def system_pick_directory(initial_dir=None):
     Falls back to Tk's filedialog if none are available (return None and let caller handle).
     """
     initial_dir = str(Path(initial_dir or Path.home()).expanduser())
-    desktop = (os.environ.get("XDG_CURRENT_DESKTOP", "") + " " +
-               os.environ.get("DESKTOP_SESSION", "")).upper()
-    prefer_kde = "KDE" in desktop or "PLASMA" in desktop or os.environ.get("KDE_FULL_SESSION") == "true"
+    prefer_kde = _PREFER_KDE
 
     cmds = []
-    if prefer_kde and shutil.which("kdialog"):
-        cmds.append(["kdialog", "--getexistingdirectory", initial_dir])
+    if prefer_kde and _KDIALOG:
+        cmds.append([_KDIALOG, "--getexistingdirectory", initial_dir])
     # zenity works well across GNOME, Cinnamon, MATE, XFCE (if installed)
-    if shutil.which("zenity"):
+    if _ZENITY:
         idir = initial_dir if initial_dir.endswith(os.sep) else initial_dir + os.sep
-        cmds.append(["zenity", "--file-selection", "--directory", "--filename", idir])
+        cmds.append([_ZENITY, "--file-selection", "--directory", "--filename", idir])
     # Try both even if desktop guess was wrong
-    if not prefer_kde and shutil.which("kdialog"):
-        cmds.append(["kdialog", "--getexistingdirectory", initial_dir])
+    if not prefer_kde and _KDIALOG:
+        cmds.append([_KDIALOG, "--getexistingdirectory", initial_dir])
 
     for cmd in cmds:
         try:
@@ -100,55 +127,124 @@ def load_config():
         "duration": "",                  # SMIL time like "1h", "00:30:00", etc.
         "use_v4l2": False,
         "v4l2_input": "/dev/video0",
-        "dvgrab_path": shutil.which("dvgrab") or "dvgrab",
-        # Track next index per base output dir to make tapeN folders. We'll
-        # still auto-scan folders on each start to avoid collisions.
+        "dvgrab_path": which_dvgrab("dvgrab"),
+        # Track next index per base output dir to make tapeN folders. The
+        # folders are only scanned when that index's folder already exists.
         "next_index_by_dir": {}
     }
 
-def save_config(cfg):
+def save_config(cfg, pretty=False):
+    # Compact output stays on json's C encoder; pretty is for explicit saves.
     CONFIG_DIR.mkdir(parents=True, exist_ok=True)
     tmp = CONFIG_FILE.with_suffix(".tmp")
+    if pretty:
+        data = json.dumps(cfg, indent=2, sort_keys=True)
+    else:
+        data = json.dumps(cfg, separators=(",", ":"))
     with open(tmp, "w", encoding="utf-8") as f:
-        json.dump(cfg, f, indent=2, sort_keys=True)
+        f.write(data)
     os.replace(tmp, CONFIG_FILE)
 
+def _scan_max_index(base_dir: Path, prefix: str) -> int:
+    # Highest N among existing prefix+digits folders, 0 if none (or unreadable).
+    max_found = 0
+    plen = len(prefix)
+    try:
+        # scandir exposes the d_type hint, so is_dir() only stat()s symlinks;
+        # those are followed so a linked tapeN still counts as taken
+        with os.scandir(base_dir) as it:
+            for entry in it:
+                name = entry.name
+                if name.startswith(prefix) and entry.is_dir():
+                    tail = name[plen:]
+                    # isdecimal() matches the same set as \d and is always int()-able
+                    if tail and tail.isdecimal():
+                        n = int(tail)
+                        if n > max_found:
+                            max_found = n
+    except Exception:
+        pass
+    return max_found
+
+def _peek_next_subfolder(base_dir: Path, prefix: str, cfg) -> Path:
+    # What find_next_subfolder would pick, without touching cfg or the disk.
+    base_dir = base_dir.expanduser().resolve()
+    next_map = cfg.get("next_index_by_dir", {})
+    key = str(base_dir)
+    start_idx = int(next_map.get(key, 1))
+    # Mirror the fast path: a free slot at the persisted counter wins outright
+    # (lexists, since mkdir also refuses files and dangling symlinks).
+    if key in next_map:
+        candidate = base_dir / f"{prefix}{start_idx}"
+        if not os.path.lexists(candidate):
+            return candidate
+    idx = max(start_idx, _scan_max_index(base_dir, prefix) + 1)
+    return base_dir / f"{prefix}{idx}"
+
 def find_next_subfolder(base_dir: Path, prefix: str, cfg) -> Path:
-    # Prefer persisted counter, but verify against actual folders to avoid collisions.
+    # Prefer persisted counter; scan the actual folders only if its slot is taken.
+    # The returned folder already exists on disk. Because a free slot is used
+    # as-is, tapeN folders created outside the app (e.g. tape9 with the counter
+    # at 3) don't push the numbering forward, so numbers can go backwards.
     base_dir = base_dir.expanduser().resolve()
     base_dir.mkdir(parents=True, exist_ok=True)
     next_map = cfg.get("next_index_by_dir", {})
     key = str(base_dir)
     start_idx = int(next_map.get(key, 1))
 
-    # Scan existing folders with pattern prefix + digits
-    max_found = 0
-    pat = re.compile(rf"^{re.escape(prefix)}(\d+)$")
-    try:
-        for p in base_dir.iterdir():
-            if p.is_dir():
-                m = pat.match(p.name)
-                if m:
-                    n = int(m.group(1))
-                    if n > max_found:
-                        max_found = n
-    except Exception:
-        pass
+    # Fast path: trust a persisted counter and let mkdir detect collisions.
+    if key in next_map:
+        candidate = base_dir / f"{prefix}{start_idx}"
+        try:
+            candidate.mkdir(parents=True)
+        except FileExistsError:
+            pass  # stale counter; fall back to scanning
+        else:
+            next_map[key] = start_idx + 1
+            cfg["next_index_by_dir"] = next_map
+            return candidate
 
-    idx = max(start_idx, max_found + 1)
+    idx = max(start_idx, _scan_max_index(base_dir, prefix) + 1)
     # finalize
     candidate = base_dir / f"{prefix}{idx}"
+    candidate.mkdir(parents=True, exist_ok=True)
     # Store next for *future* captures
     next_map[key] = idx + 1
     cfg["next_index_by_dir"] = next_map
     return candidate
 
-def which_dvgrab(path_pref: str) -> str:
+_DVGRAB_HITS = {}  # dvgrab setting -> resolved path; misses are never cached
+
+def _resolve_dvgrab(path_pref: str):
+    """
+    Resolve the dvgrab setting to (path, found).
+    Only successful lookups are cached, so a dvgrab installed while the app
+    is open is picked up on the next try.
+    """
+    hit = _DVGRAB_HITS.get(path_pref)
+    if hit is not None:
+        return hit, True
     # If user typed an absolute/relative path, use it; else search PATH.
-    if path_pref and (Path(path_pref).exists() or "/" in path_pref):
-        return path_pref
-    found = shutil.which(path_pref or "dvgrab")
-    return found or path_pref or "dvgrab"
+    if path_pref:
+        if os.path.exists(path_pref):
+            found = path_pref
+        elif "/" in path_pref:
+            return path_pref, False
+        elif path_pref == "dvgrab":
+            found = _DVGRAB or shutil.which("dvgrab")
+        else:
+            found = shutil.which(path_pref)
+    else:
+        found = _DVGRAB or shutil.which("dvgrab")
+    if not found:
+        return path_pref or "dvgrab", False
+    if len(_DVGRAB_HITS) >= 8:
+        _DVGRAB_HITS.clear()
+    _DVGRAB_HITS[path_pref] = found
+    return found, True
+
+def which_dvgrab(path_pref: str) -> str:
+    return _resolve_dvgrab(path_pref)[0]
 
 # --------------------------- Command Builder ---------------------------
 
@@ -157,6 +253,7 @@ def build_dvgrab_cmd(values: dict, capture_dir: Path) -> list:
     Compose dvgrab command from GUI state.
     We point dvgrab to write files inside capture_dir with base 'clip-'.
     Let dvgrab decide extensions based on -format (or extension-less base).
+    Expects the typed, stripped dict produced by App._gather_values.
     """
     dvgrab_bin = which_dvgrab(values["dvgrab_path"])
     cmd = [dvgrab_bin]
@@ -166,10 +263,8 @@ def build_dvgrab_cmd(values: dict, capture_dir: Path) -> list:
     if fmt:
         # dvgrab man page accepts -format dv1|dv2|avi|raw|dif|qt|mov|jpeg|jpg|mpeg2|hdv
         # We keep a conservative subset here.
-        if fmt == "mpeg2":
-            cmd += ["-format", "mpeg2"]
-        elif fmt in ("dv2", "dv1", "raw", "qt", "mov", "avi"):
-            cmd += ["-format", fmt]
+        if fmt in ("dv2", "dv1", "raw", "qt", "mov", "avi", "mpeg2"):
+            cmd.extend(("-format", fmt))
 
     # Filename scheme
     scheme = values["filename_scheme"]
@@ -181,65 +276,65 @@ def build_dvgrab_cmd(values: dict, capture_dir: Path) -> list:
         cmd.append("-timesys")
 
     # Splitting
-    size_mb = int(values.get("size_mb") or 0)
+    size_mb = values["size_mb"]
     if size_mb >= 0:
-        cmd += ["-size", str(size_mb)]
-    frames_per_file = int(values.get("frames_per_file") or 0)
+        cmd.extend(("-size", str(size_mb)))
+    frames_per_file = values["frames_per_file"]
     if frames_per_file > 0:
-        cmd += ["-frames", str(frames_per_file)]
-    if values.get("autosplit"):
-        secs = int(values.get("autosplit_seconds") or 0)
+        cmd.extend(("-frames", str(frames_per_file)))
+    if values["autosplit"]:
+        secs = values["autosplit_seconds"]
         # -autosplit or -autosplit=SECONDS
         if secs > 0:
             cmd.append(f"-autosplit={secs}")
         else:
             cmd.append("-autosplit")
-    csize_mb = int(values.get("csize_mb") or 0)
+    csize_mb = values["csize_mb"]
     if csize_mb > 0:
-        cmd += ["-csize", str(csize_mb)]
-    cmincutsize_mb = int(values.get("cmincutsize_mb") or 0)
+        cmd.extend(("-csize", str(csize_mb)))
+    cmincutsize_mb = values["cmincutsize_mb"]
     if cmincutsize_mb > 0:
-        cmd += ["-cmincutsize", str(cmincutsize_mb)]
+        cmd.extend(("-cmincutsize", str(cmincutsize_mb)))
 
     # Controls & behaviors
-    if values.get("showstatus", True):
+    if values["showstatus"]:
         cmd.append("-showstatus")
-    if values.get("rewind", False):
+    if values["rewind"]:
         cmd.append("-rewind")
-    if values.get("noavc", False):
+    if values["noavc"]:
         cmd.append("-noavc")
-    if values.get("recordonly", False):
+    if values["recordonly"]:
         cmd.append("-recordonly")
-    if values.get("opendml", False) and fmt == "dv2":
+    if values["opendml"] and fmt == "dv2":
         cmd.append("-opendml")
 
     # Device routing
-    card = str(values.get("card") or "").strip()
+    card = values["card"]
     if card.isdigit():
-        cmd += ["-card", card]
-    channel = str(values.get("channel") or "").strip()
+        cmd.extend(("-card", card))
+    channel = values["channel"]
     if channel.isdigit():
-        cmd += ["-channel", channel]
-    guid = str(values.get("guid") or "").strip()
+        cmd.extend(("-channel", channel))
+    guid = values["guid"]
     if guid:
-        cmd += ["-guid", guid]
+        cmd.extend(("-guid", guid))
 
     # V4L2 (USB DV) path
-    if values.get("use_v4l2", False):
+    if values["use_v4l2"]:
         cmd.append("-v4l2")
-        v4l2_input = str(values.get("v4l2_input") or "").strip()
+        v4l2_input = values["v4l2_input"]
         if v4l2_input:
-            cmd += ["-input", v4l2_input]
+            cmd.extend(("-input", v4l2_input))
 
     # Time limiting across splits
-    dur = str(values.get("duration") or "").strip()
+    dur = values["duration"]
     if dur:
-        cmd += ["-duration", dur]
+        cmd.extend(("-duration", dur))
 
     # Decimation
-    every = int(values.get("every_nth") or 1)
-    if every and every > 1:
-        cmd += ["-every", str(every)]
+    every = values["every_nth"]
+    if every > 1:
+        cmd.extend(("-every", str(every)))
 
     # Base name inside capture_dir; trailing dash gives "clip-001.ext" etc.
     base = (capture_dir / "clip-").as_posix()
@@ -255,27 +350,78 @@ class App(ttk.Frame):
         self.master.minsize(820, 620)
         self.pack(fill="both", expand=True)
 
-        self.cfg = load_config()
+        self.cfg = {}  # filled in by _apply_loaded_config once the file is read
+        self._cfg_loaded = False
+        self._save_pending = None  # pretty flag of a save requested before loading
         self.proc = None
         self.proc_thread = None
-        self.log_q = queue.Queue()
+        # (text, is_err) batches from the reader thread, capped at LOG_LINES_MAX
+        # lines in total: a stalled UI drops the oldest output, which the log
+        # widget would have trimmed anyway.
+        self._log_dq = collections.deque()
+        self._log_dq_lines = 0  # total entries across the queued batches
+        self._log_lock = threading.Lock()
+        self._residue = b""  # partial output line carried between reads
+        # Unix Tk can wake the main loop on pipe activity; elsewhere use
+        # a reader thread plus a polled deque.
+        self._use_filehandler = hasattr(self.master.tk, "createfilehandler")
         self.stop_requested = False
+        self._save_after_id = None
+        self._live = {}  # var key -> current value, kept fresh by write traces
+        self._vars = {}  # var key -> tk variable
+        self._dirty = set()  # keys the user edited before the config loaded
 
         self._build_widgets()
+        self._load_from_config()  # defaults until the saved settings arrive
+        self._dirty.clear()
+        if not self._use_filehandler:
+            self._schedule_log_pump()
+
+        self.master.protocol("WM_DELETE_WINDOW", self.on_close)
+        # Read the config file off the main thread so the window paints first
+        threading.Thread(target=self._load_cfg_bg, daemon=True).start()
+
+    def _load_cfg_bg(self):
+        cfg = {}
+        try:
+            cfg = load_config()
+        finally:
+            # Always report back, or saves would stay disabled all session
+            self.master.after(0, self._apply_loaded_config, cfg)
+
+    def _apply_loaded_config(self, cfg):
+        # Keep whatever the user did while the file was loading: form edits
+        # win over saved values, and tape counters only move forward.
+        edited = {key: self._live[key] for key in self._dirty}
+        next_map = dict(cfg.get("next_index_by_dir", {}))
+        for key, idx in self.cfg.get("next_index_by_dir", {}).items():
+            next_map[key] = max(int(next_map.get(key, 1)), idx)
+        self.cfg.update(cfg)
+        self.cfg["next_index_by_dir"] = next_map
+        self._cfg_loaded = True
         self._load_from_config()
-        self._schedule_log_pump()
+        for key, value in edited.items():
+            self._vars[key].set(value)
+        self._dirty.clear()
+        if edited:
+            # Fold them into cfg as well, or the next save writes the old values
+            self.cfg.update(self._gather_values())
+
+        if self._save_pending is not None:
+            pretty, self._save_pending = self._save_pending, None
+            self._flush_save(pretty=pretty)
+            if pretty:
+                self._log("Settings saved.", is_err=False)
 
         # Warn if dvgrab not found
-        dv_path = which_dvgrab(self.cfg.get("dvgrab_path", "dvgrab"))
-        if not shutil.which(dv_path) and not Path(dv_path).exists():
+        _, found = _resolve_dvgrab(self.cfg.get("dvgrab_path", "dvgrab"))
+        if not found:
             messagebox.showwarning(
                 "dvgrab not found",
                 "Could not find 'dvgrab' on PATH.\n"
                 "Install it (e.g., sudo apt install dvgrab) or set the dvgrab path in Advanced."
             )
 
-        self.master.protocol("WM_DELETE_WINDOW", self.on_close)
-
     def _build_widgets(self):
         # Top-level layout: notebook + bottom button bar + log
         self.nb = ttk.Notebook(self)
@@ -288,7 +434,7 @@ class App(ttk.Frame):
 
         # ------------------ Basic Tab ------------------
         row = 0
-        self.output_dir_var = tk.StringVar()
+        self.output_dir_var = self._track(tk.StringVar(), "output_dir")
         ttk.Label(self.basic, text="Output directory (base for all tapes):").grid(row=row, column=0, sticky="w", padx=8, pady=4)
         out_frame = ttk.Frame(self.basic)
         out_frame.grid(row=row, column=1, sticky="ew", padx=8, pady=4)
@@ -297,13 +443,13 @@ class App(ttk.Frame):
         ttk.Button(out_frame, text="Browse…", command=self.choose_output_dir).pack(side="left", padx=(6,0))
         row += 1
 
-        self.subprefix_var = tk.StringVar()
+        self.subprefix_var = self._track(tk.StringVar(), "subfolder_prefix")
         ttk.Label(self.basic, text="Subfolder prefix (auto-numbered):").grid(row=row, column=0, sticky="w", padx=8, pady=4)
         ttk.Entry(self.basic, textvariable=self.subprefix_var, width=16).grid(row=row, column=1, sticky="w", padx=8, pady=4)
         row += 1
 
         # Format and naming
-        self.format_var = tk.StringVar()
+        self.format_var = self._track(tk.StringVar(), "format_label")
         ttk.Label(self.basic, text="Format:").grid(row=row, column=0, sticky="w", padx=8, pady=4)
         fmt_combo = ttk.Combobox(self.basic, textvariable=self.format_var, state="readonly",
                                  values=[
@@ -312,7 +458,7 @@ class App(ttk.Frame):
         fmt_combo.grid(row=row, column=1, sticky="w", padx=8, pady=4)
         row += 1
 
-        self.scheme_var = tk.StringVar()
+        self.scheme_var = self._track(tk.StringVar(), "filename_scheme")
         self.scheme_var.set("timestamp")
         scheme_frame = ttk.Frame(self.basic)
         scheme_frame.grid(row=row, column=0, columnspan=2, sticky="w", padx=8, pady=4)
@@ -322,9 +468,9 @@ class App(ttk.Frame):
         row += 1
 
         # Splitting
-        self.size_mb_var = tk.StringVar()
-        self.autosplit_var = tk.BooleanVar()
-        self.autosplit_secs_var = tk.StringVar()
+        self.size_mb_var = self._track(tk.StringVar(), "size_mb")
+        self.autosplit_var = self._track(tk.BooleanVar(), "autosplit")
+        self.autosplit_secs_var = self._track(tk.StringVar(), "autosplit_seconds")
         split_fr = ttk.LabelFrame(self.basic, text="Splitting")
         split_fr.grid(row=row, column=0, columnspan=2, sticky="ew", padx=8, pady=8)
         split_fr.columnconfigure(1, weight=1)
@@ -336,11 +482,11 @@ class App(ttk.Frame):
         row += 1
 
         # Behavior toggles
-        self.showstatus_var = tk.BooleanVar()
-        self.rewind_var = tk.BooleanVar()
-        self.noavc_var = tk.BooleanVar()
-        self.recordonly_var = tk.BooleanVar()
-        self.opendml_var = tk.BooleanVar()
+        self.showstatus_var = self._track(tk.BooleanVar(), "showstatus")
+        self.rewind_var = self._track(tk.BooleanVar(), "rewind")
+        self.noavc_var = self._track(tk.BooleanVar(), "noavc")
+        self.recordonly_var = self._track(tk.BooleanVar(), "recordonly")
+        self.opendml_var = self._track(tk.BooleanVar(), "opendml")
         toggles = ttk.Frame(self.basic)
         toggles.grid(row=row, column=0, columnspan=2, sticky="w", padx=8, pady=4)
         ttk.Checkbutton(toggles, text="Show status", variable=self.showstatus_var).pack(side="left", padx=(0,12))
@@ -366,14 +512,14 @@ class App(ttk.Frame):
 
         # ------------------ Advanced Tab ------------------
         r = 0
-        self.dvgrab_path_var = tk.StringVar()
+        self.dvgrab_path_var = self._track(tk.StringVar(), "dvgrab_path")
         ttk.Label(self.adv, text="dvgrab path (leave as 'dvgrab' if on PATH):").grid(row=r, column=0, sticky="w", padx=8, pady=4)
         ttk.Entry(self.adv, textvariable=self.dvgrab_path_var).grid(row=r, column=1, sticky="ew", padx=8, pady=4)
         self.adv.grid_columnconfigure(1, weight=1)
         r += 1
 
-        self.frames_per_file_var = tk.StringVar()
-        self.every_nth_var = tk.StringVar()
+        self.frames_per_file_var = self._track(tk.StringVar(), "frames_per_file")
+        self.every_nth_var = self._track(tk.StringVar(), "every_nth")
         grid1 = ttk.Frame(self.adv); grid1.grid(row=r, column=0, columnspan=2, sticky="ew", padx=8, pady=2)
         ttk.Label(grid1, text="Frames per file (0=off):").grid(row=0, column=0, sticky="w", padx=4, pady=4)
         ttk.Entry(grid1, textvariable=self.frames_per_file_var, width=10).grid(row=0, column=1, sticky="w", padx=4, pady=4)
@@ -381,8 +527,8 @@ class App(ttk.Frame):
         ttk.Entry(grid1, textvariable=self.every_nth_var, width=10).grid(row=0, column=3, sticky="w", padx=4, pady=4)
         r += 1
 
-        self.csize_mb_var = tk.StringVar()
-        self.cmincutsize_mb_var = tk.StringVar()
+        self.csize_mb_var = self._track(tk.StringVar(), "csize_mb")
+        self.cmincutsize_mb_var = self._track(tk.StringVar(), "cmincutsize_mb")
         grid2 = ttk.Frame(self.adv); grid2.grid(row=r, column=0, columnspan=2, sticky="ew", padx=8, pady=2)
         ttk.Label(grid2, text="Collection size MB (0=off):").grid(row=0, column=0, sticky="w", padx=4, pady=4)
         ttk.Entry(grid2, textvariable=self.csize_mb_var, width=10).grid(row=0, column=1, sticky="w", padx=4, pady=4)
@@ -390,9 +536,9 @@ class App(ttk.Frame):
         ttk.Entry(grid2, textvariable=self.cmincutsize_mb_var, width=10).grid(row=0, column=3, sticky="w", padx=4, pady=4)
         r += 1
 
-        self.card_var = tk.StringVar()
-        self.channel_var = tk.StringVar()
-        self.guid_var = tk.StringVar()
+        self.card_var = self._track(tk.StringVar(), "card")
+        self.channel_var = self._track(tk.StringVar(), "channel")
+        self.guid_var = self._track(tk.StringVar(), "guid")
         grid3 = ttk.Frame(self.adv); grid3.grid(row=r, column=0, columnspan=2, sticky="ew", padx=8, pady=2)
         ttk.Label(grid3, text="FireWire card #").grid(row=0, column=0, sticky="w", padx=4, pady=4)
         ttk.Entry(grid3, textvariable=self.card_var, width=8).grid(row=0, column=1, sticky="w", padx=4, pady=4)
@@ -402,13 +548,13 @@ class App(ttk.Frame):
         ttk.Entry(grid3, textvariable=self.guid_var, width=16).grid(row=0, column=5, sticky="w", padx=4, pady=4)
         r += 1
 
-        self.duration_var = tk.StringVar()
+        self.duration_var = self._track(tk.StringVar(), "duration")
         ttk.Label(self.adv, text="Max capture duration (SMIL time, e.g., 1h, 30min, 00:30:00):").grid(row=r, column=0, sticky="w", padx=8, pady=4)
         ttk.Entry(self.adv, textvariable=self.duration_var).grid(row=r, column=1, sticky="ew", padx=8, pady=4)
         r += 1
 
-        self.use_v4l2_var = tk.BooleanVar()
-        self.v4l2_input_var = tk.StringVar()
+        self.use_v4l2_var = self._track(tk.BooleanVar(), "use_v4l2")
+        self.v4l2_input_var = self._track(tk.StringVar(), "v4l2_input")
         v4 = ttk.Frame(self.adv); v4.grid(row=r, column=0, columnspan=2, sticky="ew", padx=8, pady=2)
         ttk.Checkbutton(v4, text="Use V4L2 (USB DV)", variable=self.use_v4l2_var).grid(row=0, column=0, sticky="w", padx=4, pady=4)
         ttk.Label(v4, text="V4L2 device (input):").grid(row=0, column=1, sticky="w", padx=4, pady=4)
@@ -425,8 +571,22 @@ class App(ttk.Frame):
         yscroll.pack(side="right", fill="y")
         self.log.config(yscrollcommand=yscroll.set)
         self.log.tag_configure("err", foreground="#b00")
+        self._log_lines = 0  # mirrors the Text line count without asking Tcl
         self.last_folder = None
 
+    def _track(self, var, key):
+        # Mirror the variable into self._live on every write so reading the
+        # form later needs no Tcl round-trips.
+        self._live[key] = var.get()
+        self._vars[key] = var
+        var.trace_add("write", lambda *_: self._on_var_write(key, var))
+        return var
+
+    def _on_var_write(self, key, var):
+        self._live[key] = var.get()
+        if not self._cfg_loaded:
+            self._dirty.add(key)
+
     def _load_from_config(self):
         c = self.cfg
         self.output_dir_var.set(c.get("output_dir", DEFAULT_OUTPUT))
@@ -463,11 +623,11 @@ class App(ttk.Frame):
         self.duration_var.set(str(c.get("duration", "")))
         self.use_v4l2_var.set(bool(c.get("use_v4l2", False)))
         self.v4l2_input_var.set(str(c.get("v4l2_input", "/dev/video0")))
-        self.dvgrab_path_var.set(str(c.get("dvgrab_path", shutil.which("dvgrab") or "dvgrab")))
+        self.dvgrab_path_var.set(str(c.get("dvgrab_path") or which_dvgrab("dvgrab")))
 
     def _gather_values(self):
+        live = self._live
         # Map the combobox label back to dvgrab -format token
-        fmt_label = self.format_var.get()
         fmt_map = {
             "dv2 (AVI Type 2)": "dv2",
             "dv1 (AVI Type 1)": "dv1",
@@ -477,32 +637,32 @@ class App(ttk.Frame):
             "avi": "avi",
             "mpeg2 (HDV .m2t)": "mpeg2",
         }
-        fmt = fmt_map.get(fmt_label, "dv2")
+        fmt = fmt_map.get(live["format_label"], "dv2")
 
         vals = {
-            "output_dir": self.output_dir_var.get().strip(),
-            "subfolder_prefix": self.subprefix_var.get().strip() or "tape",
-            "filename_scheme": self.scheme_var.get(),
+            "output_dir": live["output_dir"].strip(),
+            "subfolder_prefix": live["subfolder_prefix"].strip() or "tape",
+            "filename_scheme": live["filename_scheme"],
             "format": fmt,
-            "showstatus": bool(self.showstatus_var.get()),
-            "autosplit": bool(self.autosplit_var.get()),
-            "autosplit_seconds": _as_int(self.autosplit_secs_var.get(), 0),
-            "size_mb": _as_int(self.size_mb_var.get(), 0),
-            "csize_mb": _as_int(self.csize_mb_var.get(), 0),
-            "cmincutsize_mb": _as_int(self.cmincutsize_mb_var.get(), 0),
-            "rewind": bool(self.rewind_var.get()),
-            "noavc": bool(self.noavc_var.get()),
-            "recordonly": bool(self.recordonly_var.get()),
-            "opendml": bool(self.opendml_var.get()),
-            "frames_per_file": _as_int(self.frames_per_file_var.get(), 0),
-            "every_nth": _as_int(self.every_nth_var.get(), 1),
-            "card": self.card_var.get().strip(),
-            "channel": self.channel_var.get().strip(),
-            "guid": self.guid_var.get().strip(),
-            "duration": self.duration_var.get().strip(),
-            "use_v4l2": bool(self.use_v4l2_var.get()),
-            "v4l2_input": self.v4l2_input_var.get().strip(),
-            "dvgrab_path": self.dvgrab_path_var.get().strip() or "dvgrab",
+            "showstatus": bool(live["showstatus"]),
+            "autosplit": bool(live["autosplit"]),
+            "autosplit_seconds": _as_int(live["autosplit_seconds"], 0),
+            "size_mb": _as_int(live["size_mb"], 0),
+            "csize_mb": _as_int(live["csize_mb"], 0),
+            "cmincutsize_mb": _as_int(live["cmincutsize_mb"], 0),
+            "rewind": bool(live["rewind"]),
+            "noavc": bool(live["noavc"]),
+            "recordonly": bool(live["recordonly"]),
+            "opendml": bool(live["opendml"]),
+            "frames_per_file": _as_int(live["frames_per_file"], 0),
+            "every_nth": _as_int(live["every_nth"], 1),
+            "card": live["card"].strip(),
+            "channel": live["channel"].strip(),
+            "guid": live["guid"].strip(),
+            "duration": live["duration"].strip(),
+            "use_v4l2": bool(live["use_v4l2"]),
+            "v4l2_input": live["v4l2_input"].strip(),
+            "dvgrab_path": live["dvgrab_path"].strip() or "dvgrab",
             "next_index_by_dir": self.cfg.get("next_index_by_dir", {}),
         }
         return vals
@@ -510,28 +670,46 @@ class App(ttk.Frame):
     def save_settings(self):
         vals = self._gather_values()
         self.cfg.update(vals)
-        save_config(self.cfg)
-        self._log("Settings saved.", is_err=False)
+        if self._flush_save(pretty=True):
+            self._log("Settings saved.", is_err=False)
+
+    def _request_save(self):
+        # Collapse bursts of config changes into a single write.
+        if self._save_after_id is not None:
+            self.master.after_cancel(self._save_after_id)
+        self._save_after_id = self.master.after(SAVE_DEBOUNCE_MS, self._flush_save)
+
+    def _flush_save(self, pretty=False):
+        if self._save_after_id is not None:
+            self.master.after_cancel(self._save_after_id)
+            self._save_after_id = None
+        if not self._cfg_loaded:
+            # Don't overwrite the saved file with startup defaults;
+            # _apply_loaded_config writes it once the settings are in.
+            self._save_pending = bool(self._save_pending) or pretty
+            return False
+        save_config(self.cfg, pretty=pretty)
+        return True
 
     def choose_output_dir(self):
         # Try native picker first
-        picked = system_pick_directory(self.output_dir_var.get() or DEFAULT_OUTPUT)
+        picked = system_pick_directory(self._live["output_dir"] or DEFAULT_OUTPUT)
         if not picked:
             # Fallback to Tk dialog
-            picked = filedialog.askdirectory(initialdir=self.output_dir_var.get() or DEFAULT_OUTPUT)
+            picked = filedialog.askdirectory(initialdir=self._live["output_dir"] or DEFAULT_OUTPUT)
         if picked:
             self.output_dir_var.set(picked)
             # optionally persist immediately so next launch remembers it
             self.cfg["output_dir"] = picked
-            save_config(self.cfg)
+            self._request_save()
 
 
     def copy_command(self):
         try:
             vals = self._gather_values()
             base_dir = Path(vals["output_dir"]).expanduser()
-            subdir = find_next_subfolder(base_dir, vals["subfolder_prefix"], self.cfg)
-            # Do not increment persistently on a dry-run; rebuild without storing
+            # Dry-run: preview the folder without bumping the persisted counter
+            subdir = _peek_next_subfolder(base_dir, vals["subfolder_prefix"], self.cfg)
             cmd = build_dvgrab_cmd(vals, capture_dir=subdir)
             cmd_str = " ".join(shlex.quote(x) for x in cmd)
             self.master.clipboard_clear()
@@ -541,12 +719,11 @@ class App(ttk.Frame):
             messagebox.showerror("Error", f"Failed to build command: {e}")
 
     def open_last_folder(self):
-        if not self.last_folder or not Path(self.last_folder).exists():
+        if not self.last_folder or not os.path.isdir(self.last_folder):
             messagebox.showinfo("Open Folder", "No recent capture folder yet.")
             return
         try:
-            # xdg-open fallback
-            subprocess.Popen(["xdg-open", str(self.last_folder)])
+            subprocess.Popen(_FOLDER_OPENER + [str(self.last_folder)])
         except Exception as e:
             messagebox.showerror("Open Folder", f"Failed to open folder: {e}")
 
@@ -558,8 +735,8 @@ class App(ttk.Frame):
             return
         vals = self._gather_values()
 
-        dv_path = which_dvgrab(vals["dvgrab_path"])
-        if not shutil.which(dv_path) and not Path(dv_path).exists():
+        dv_path, found = _resolve_dvgrab(vals["dvgrab_path"])
+        if not found:
             messagebox.showerror("dvgrab not found",
                                  f"dvgrab not found at '{dv_path}'. Install it or update Advanced → dvgrab path.")
             return
@@ -570,9 +747,8 @@ class App(ttk.Frame):
             return
         # Allocate subfolder and persist next index
         subdir = find_next_subfolder(base_dir, vals["subfolder_prefix"], self.cfg)
-        subdir.mkdir(parents=True, exist_ok=True)
         self.last_folder = subdir
-        save_config(self.cfg)  # persist the updated next_index_by_dir now
+        self._request_save()  # persist the updated next_index_by_dir
 
         cmd = build_dvgrab_cmd(vals, capture_dir=subdir)
 
@@ -584,10 +760,9 @@ class App(ttk.Frame):
             self.proc = subprocess.Popen(
                 cmd,
                 stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                bufsize=1,
-                preexec_fn=os.setsid  # new process group
+                stderr=subprocess.STDOUT,  # one pipe; errors tagged by prefix
+                bufsize=0,  # read via os.read() on the raw fd
+                start_new_session=True  # new process group
             )
         except Exception as e:
             self.proc = None
@@ -597,8 +772,11 @@ class App(ttk.Frame):
         self.start_btn.config(state="disabled")
         self.stop_btn.config(state="normal")
         self.status_var.set("Capturing…")
-        self.proc_thread = threading.Thread(target=self._pump_process, daemon=True)
-        self.proc_thread.start()
+        if self._use_filehandler:
+            self._watch_output()
+        else:
+            self.proc_thread = threading.Thread(target=self._pump_process, daemon=True)
+            self.proc_thread.start()
 
     def stop_capture(self):
         if self.proc is None:
@@ -614,34 +792,82 @@ class App(ttk.Frame):
                 pass
         self._log("Stop signal sent.", is_err=False)
 
+    def _watch_output(self):
+        # Let Tk call us back only when dvgrab has actually written something.
+        fd = self.proc.stdout.fileno()
+        os.set_blocking(fd, False)
+        self._residue = b""
+        self.master.tk.createfilehandler(fd, tk.READABLE, self._on_output_readable)
+
+    def _on_output_readable(self, fd, mask):
+        try:
+            chunk = os.read(fd, READ_CHUNK)
+        except BlockingIOError:
+            return
+        except OSError:
+            chunk = b""
+        if chunk:
+            lines, self._residue = _split_lines(self._residue + chunk)
+            if lines:
+                self._log_batch([(line, _is_error_line(line)) for line in lines])
+            return
+        # EOF: flush any unterminated tail and stop watching the pipe
+        if self._residue.strip():
+            line = self._residue.decode("utf-8", "replace").rstrip()
+            self._log(line, is_err=_is_error_line(line))
+        self._residue = b""
+        self.master.tk.deletefilehandler(fd)
+        try:
+            self.proc.stdout.close()
+        except Exception:
+            pass
+        self._reap_process()
+
+    def _reap_process(self):
+        # The pipe is closed; dvgrab is exiting or already gone.
+        proc = self.proc
+        if proc is None:
+            return
+        ret = proc.poll()
+        if ret is None:
+            self.master.after(100, self._reap_process)
+            return
+        self._log(f"dvgrab exited with code {ret}", is_err=bool(ret))
+        self.proc = None
+        self._on_capture_finished()
+
     def _pump_process(self):
-        # Read stdout/stderr lines and put to queue.
+        # Read dvgrab output and hand it to the log pump.
         try:
             assert self.proc is not None
-            for stream, tag in [(self.proc.stdout, None), (self.proc.stderr, "err")]:
-                t = threading.Thread(target=self._read_stream, args=(stream, tag), daemon=True)
-                t.start()
+            t = threading.Thread(target=self._read_stream, args=(self.proc.stdout,), daemon=True)
+            t.start()
 
             ret = self.proc.wait()
-            self.log_q.put(("[exit]", None))
-            self.log_q.put((f"dvgrab exited with code {ret}", "err" if ret else None))
+            t.join()  # let the last output land before the exit line
+            self._enqueue_log([(f"dvgrab exited with code {ret}", bool(ret))])
         finally:
             self.proc = None
             self.master.after(0, self._on_capture_finished)
 
-    def _read_stream(self, stream, tag):
+    def _read_stream(self, stream):
         if stream is None:
             return
-        for line in iter(stream.readline, ""):
-            # dvgrab --showstatus prints carriage-return updates; normalize
-            if "\r" in line:
-                # show latest status line on its own
-                parts = line.split("\r")
-                for p in parts:
-                    if p.strip():
-                        self.log_q.put((p.rstrip(), tag))
-            else:
-                self.log_q.put((line.rstrip(), tag))
+        fd = stream.fileno()
+        residue = b""
+        while True:
+            try:
+                chunk = os.read(fd, READ_CHUNK)
+            except OSError:
+                break
+            if not chunk:
+                break
+            lines, residue = _split_lines(residue + chunk)
+            if lines:
+                self._enqueue_log([(line, _is_error_line(line)) for line in lines])
+        if residue.strip():
+            line = residue.decode("utf-8", "replace").rstrip()
+            self._enqueue_log([(line, _is_error_line(line))])
         try:
             stream.close()
         except Exception:
@@ -652,24 +878,60 @@ class App(ttk.Frame):
         self.stop_btn.config(state="disabled")
         self.status_var.set("Idle.")
 
+    def _enqueue_log(self, entries):
+        with self._log_lock:
+            self._log_dq.append(entries)
+            self._log_dq_lines += len(entries)
+            # The widget keeps only LOG_LINES_MAX lines, so older ones can go
+            excess = self._log_dq_lines - LOG_LINES_MAX
+            while excess > 0:
+                oldest = self._log_dq[0]
+                if len(oldest) <= excess:
+                    self._log_dq.popleft()
+                    excess -= len(oldest)
+                    self._log_dq_lines -= len(oldest)
+                else:
+                    self._log_dq[0] = oldest[excess:]
+                    self._log_dq_lines -= excess
+                    excess = 0
+
     def _schedule_log_pump(self):
-        try:
-            while True:
-                line, tag = self.log_q.get_nowait()
-                if line == "[exit]":
-                    continue
-                self._log(line, is_err=(tag == "err"))
-        except queue.Empty:
-            pass
+        with self._log_lock:
+            batches = list(self._log_dq)
+            self._log_dq.clear()
+            self._log_dq_lines = 0
+        entries = []
+        for batch in batches:
+            entries.extend(batch)
+        if entries:
+            self._log_batch(entries)
         self.master.after(60, self._schedule_log_pump)
 
     def _log(self, text, is_err=False):
+        self._log_batch([(text, is_err)])
+
+    def _log_batch(self, entries):
+        # One Text insert (and one redraw) per batch: consecutive lines that
+        # share a tag are joined, and each run is passed as a chars/tags pair.
         ts = datetime.now().strftime("%H:%M:%S")
-        tag = "err" if is_err else None
-        self.log.insert("end", f"[{ts}] {text}\n", tag)
-        # Trim
-        if int(self.log.index('end-1c').split('.')[0]) > LOG_LINES_MAX:
-            self.log.delete("1.0", "2.0")
+        args = []
+        added = 0
+        run, run_err = [], None
+        for text, is_err in entries:
+            if run and is_err != run_err:
+                args += ["".join(run), "err" if run_err else ""]
+                run = []
+            run_err = is_err
+            run.append(f"[{ts}] {text}\n")
+            added += text.count("\n") + 1
+        args += ["".join(run), "err" if run_err else ""]
+        self.log.insert("end", *args)
+        self._log_lines += added
+        # Trim in large chunks so the delete cost is amortized
+        if self._log_lines > LOG_LINES_MAX:
+            trim = self._log_lines - LOG_LINES_MAX + LOG_TRIM_LINES
+            self.log.delete("1.0", f"{trim + 1}.0")
+            self._log_lines = max(self._log_lines - trim, 0)
         self.log.see("end")
 
     def on_close(self):
@@ -690,6 +952,34 @@ class App(ttk.Frame):
 
 # --------------------------- Helpers ---------------------------
 
+def _split_lines(buf: bytes):
+    """
+    Split raw pipe output into display lines.
+    dvgrab -showstatus ends status updates with a bare CR; a run of those
+    collapses to the newest one, and CR also flushes a line so status shows
+    up live. Returns (lines, residue) where residue is the trailing partial
+    line to prepend to the next read.
+    """
+    cut = max(buf.rfind(b"\n"), buf.rfind(b"\r")) + 1
+    if not cut:
+        return [], buf
+    text = buf[:cut].decode("utf-8", "replace")
+    lines = []
+    for ln in text.split("\n"):
+        # rstrip() also drops the trailing CR, so this is the last non-empty segment
+        ln = ln.rstrip().rpartition("\r")[2]
+        if ln.strip():
+            lines.append(ln)
+    return lines, buf[cut:]
+
+_ERR_PREFIXES = ("error", "warn")
+
+def _is_error_line(line: str) -> bool:
+    # stderr is merged into stdout, so pick out dvgrab's complaints by prefix.
+    # Only lines starting with "error"/"warn" are tagged; e.g.
+    # "libiec61883 error: ..." is not, though every stderr line used to be.
+    return line.lstrip().lower().startswith(_ERR_PREFIXES)
+
 def _as_int(s, default):
     try:
         v = int(str(s).strip())